@@ -0,0 +1,276 @@
+"""
+Validate the project against the constitution in .specify/memory.
+
+Extracts the principles from the constitution markdown, derives a
+checkable rule for each, and looks for supporting evidence files in
+the repository. Run directly to print a report and write report.json.
+"""
+import argparse
+import fnmatch
+import json
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+CONSTITUTION_PATH = ROOT / ".specify" / "memory" / "constitution.md"
+
+# Evidence globs per principle keyword; anything unmatched falls back
+# to the generic source tree check
+_EVIDENCE_BY_KEYWORD = {
+    "retrieval": ["src/services/retrieval_service.py",
+                  "src/services/qdrant_service.py"],
+    "hallucination": ["src/services/generation_service.py"],
+    "source of truth": ["src/services/book_service.py",
+                        "../my-website/docs"],
+    "selected text": ["src/api/routes/chat.py"],
+    "stack": ["src/api/main.py", "requirements.txt"],
+}
+_DEFAULT_EVIDENCE = ["src/**/*.py"]
+
+# One C-level scan over the whole document: each ### section is a
+# principle, captured up to the next heading of any level
+# Each ### section is a principle, captured up to the next heading of
+# any level. Bytes pattern so it can scan the mmap'd file without
+# decoding the whole document first.
+_PRINCIPLE_RE_BYTES = re.compile(
+    rb"^###\s+(.+?)\s*$(.*?)(?=^#{1,3}\s|\Z)", re.M | re.S
+)
+
+
+@dataclass(slots=True)
+class ValidationRule:
+    id: str
+    name: str
+    description: str
+    category: str
+    evidence_paths: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    rule_id: str
+    rule_name: str
+    passed: bool
+    evidence: list
+    message: str
+
+
+# materialization order for report dicts, computed once — slots
+# instances have no __dict__ to lean on, and this is cheaper anyway
+_RESULT_FIELDS = tuple(f.name for f in fields(ValidationResult))
+
+
+@lru_cache(maxsize=1000)
+def _compile_glob(pattern: str):
+    """Glob pattern -> compiled regex, shared across rules and runs."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+class ConstitutionValidator:
+    def __init__(self, constitution_path=CONSTITUTION_PATH,
+                 project_root=ROOT):
+        self.constitution_path = Path(constitution_path)
+        self.project_root = Path(project_root)
+        # pattern -> bool, shared across rules: the same evidence globs
+        # recur and each glob walk costs real syscalls
+        self._evidence_hits = {}
+
+    # The three derivation steps below are pure functions of
+    # constitution_path, so they are cached for the validator's
+    # lifetime — a report run touches them several times and should
+    # pay for one disk read and one parse. Build a fresh validator to
+    # pick up an edited constitution.
+
+    @cached_property
+    def constitution_text(self) -> str:
+        return self.constitution_path.read_text(encoding="utf-8")
+
+    @cached_property
+    def principles(self) -> list:
+        return self.extract_principles()
+
+    @cached_property
+    def rules(self) -> list:
+        return self.create_validation_rules()
+
+    @cached_property
+    def _tree(self) -> list:
+        """Relative paths of everything under the project root.
+
+        One scandir walk, amortized across every glob check — each
+        Path.glob call would otherwise re-walk the tree and re-parse
+        its pattern per rule.
+        """
+        paths = []
+        root = str(self.project_root)
+        prefix = len(root) + 1
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    paths.append(entry.path[prefix:])
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        return paths
+
+    def _glob_matches(self, pattern: str) -> bool:
+        regex = _compile_glob(pattern)
+        match = regex.match
+        return any(match(p) for p in self._tree)
+
+    def load_constitution(self) -> str:
+        """Read the constitution markdown."""
+        return self.constitution_text
+
+    def extract_principles(self) -> list:
+        """Parse principle sections out of the constitution.
+
+        The bytes regex runs straight over an mmap of the file, so the
+        kernel page cache is the only copy of the document; only the
+        captured title and section bodies are ever decoded to str.
+        Each principle's content keeps just the first three non-empty
+        lines — all any consumer (the rule descriptions) ever reads —
+        so long sections don't accumulate throwaway line lists.
+        """
+        with open(self.constitution_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [
+                    {
+                        "title": match.group(1).decode("utf-8"),
+                        "content": list(islice(
+                            (line.strip()
+                             for line in match.group(2).decode("utf-8")
+                                                       .splitlines()
+                             if line.strip()),
+                            3,
+                        )),
+                    }
+                    for match in _PRINCIPLE_RE_BYTES.finditer(mm)
+                ]
+
+    def create_validation_rules(self) -> list:
+        """Turn extracted principles into checkable rules."""
+        rules = []
+        for index, principle in enumerate(self.principles, 1):
+            title = principle["title"]
+            lowered = title.lower()
+            evidence = _DEFAULT_EVIDENCE
+            category = "general"
+            for keyword, paths in _EVIDENCE_BY_KEYWORD.items():
+                if keyword in lowered:
+                    evidence = paths
+                    category = keyword.replace(" ", "_")
+                    break
+            rules.append(ValidationRule(
+                id=f"rule-{index:02d}",
+                name=title,
+                description=" ".join(principle["content"]),
+                category=category,
+                evidence_paths=list(evidence),
+            ))
+        return rules
+
+    def validate_rule(self, rule: ValidationRule) -> ValidationResult:
+        """Look for the rule's evidence files in the project tree."""
+        evidence = []
+        for path in rule.evidence_paths:
+            hit = self._evidence_hits.get(path)
+            if hit is None:
+                hit = (self.project_root / path).exists() or \
+                    self._glob_matches(path)
+                self._evidence_hits[path] = hit
+            if hit:
+                evidence.append(path)
+        passed = bool(evidence)
+        message = (
+            "evidence found" if passed
+            else f"no evidence for: {', '.join(rule.evidence_paths)}"
+        )
+        return ValidationResult(
+            rule_id=rule.id,
+            rule_name=rule.name,
+            passed=passed,
+            evidence=evidence,
+            message=message,
+        )
+
+    def validate_all_rules(self, rules=None) -> list:
+        """Validate every rule; accepts a prebuilt rule list so callers
+        that already computed the rules don't trigger a re-parse."""
+        if rules is None:
+            rules = self.rules
+        if len(rules) <= 1:
+            return [self.validate_rule(rule) for rule in rules]
+        # each rule is stat/getdents-bound and the glob syscalls run
+        # without the GIL, so overlapping them across threads hides the
+        # filesystem latency; executor.map preserves rule order
+        workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.validate_rule, rules))
+
+    def generate_validation_report(self) -> dict:
+        # build the rules exactly once and index them by id — the
+        # per-result loop must not re-parse the constitution
+        rules = self.rules
+        rule_by_id = {rule.id: rule for rule in rules}
+        results = self.validate_all_rules(rules)
+
+        # by_category holds indices into detailed_results instead of
+        # duplicating every result dict in the serialized payload
+        detailed_results = [
+            {name: getattr(result, name) for name in _RESULT_FIELDS}
+            for result in results
+        ]
+        by_category = {}
+        for i, result in enumerate(results):
+            category = rule_by_id[result.rule_id].category
+            by_category.setdefault(category, []).append(i)
+
+        passed = sum(1 for r in results if r.passed)
+        return {
+            "total_rules": len(results),
+            "passed": passed,
+            "failed": len(results) - passed,
+            "detailed_results": detailed_results,
+            "by_category": by_category,
+        }
+
+    def print_validation_report(self) -> dict:
+        report = self.generate_validation_report()
+        print(f"Constitution: {self.constitution_path}")
+        print(f"Rules passed: {report['passed']}/{report['total_rules']}")
+        for result in report["detailed_results"]:
+            status = "PASS" if result["passed"] else "FAIL"
+            print(f"  [{status}] {result['rule_name']}: {result['message']}")
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate the repo against the constitution"
+    )
+    parser.add_argument("--output", default="report.json",
+                        help="where to write the JSON report")
+    args = parser.parse_args()
+
+    validator = ConstitutionValidator()
+    report = validator.print_validation_report()
+    # compact encode + one bytes write: the report is machine-read and
+    # indent=2 roughly triples stdlib json encode time
+    Path(args.output).write_bytes(
+        json.dumps(report, separators=(",", ":")).encode()
+    )
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
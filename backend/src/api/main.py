@@ -53,7 +53,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from src.config.settings import settings
-from src.api.routes import chat, health, books
+from src.api.routes import chat, health, books, websocket
 # from src.api.routes.books import router as books_router
 
 
@@ -90,6 +90,7 @@ def create_app():
     # Routes
     app.include_router(chat.router, prefix="/api/routes", tags=["chat"])
     app.include_router(health.router, prefix="/api/routes", tags=["health"])
+    app.include_router(websocket.router, prefix="/api/routes", tags=["websocket"])
     # app.include_router(books.router, prefix="/api/routes", tags=["books"])
 
     @app.get("/")
@@ -0,0 +1,142 @@
+"""
+WebSocket route for real-time chat with the book assistant
+"""
+import asyncio
+import json
+import uuid
+import logging
+from typing import List
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from src.services.retrieval_service import retrieval_service
+from src.services.generation_service import generation_service
+
+router = APIRouter()
+logger = logging.getLogger("rag_chatbot")
+
+# Fan broadcasts out in bounded batches so very large subscriber lists
+# don't dump thousands of tasks on the event loop at once
+BROADCAST_BATCH_SIZE = 256
+
+
+class ConnectionManager:
+    """Tracks active WebSocket connections and handles message fan-out"""
+
+    def __init__(self):
+        self.connections: List[WebSocket] = []
+
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        self.connections.append(websocket)
+        logger.info(f"WebSocket connected ({len(self.connections)} active)")
+
+    def disconnect(self, websocket: WebSocket):
+        if websocket in self.connections:
+            self.connections.remove(websocket)
+        logger.info(f"WebSocket disconnected ({len(self.connections)} active)")
+
+    async def send_personal_message(self, message: str, websocket: WebSocket):
+        await websocket.send_text(message)
+
+    async def broadcast(self, message):
+        """Send a message to every connected client concurrently.
+
+        Sends to different sockets are independent, so they are fanned out
+        with asyncio.gather instead of awaited one by one — total latency is
+        roughly the slowest send instead of the sum of all sends.
+        """
+        # Serialize once up front instead of per connection
+        if isinstance(message, dict):
+            message = json.dumps(message)
+
+        dropped = []
+        for start in range(0, len(self.connections), BROADCAST_BATCH_SIZE):
+            batch = self.connections[start:start + BROADCAST_BATCH_SIZE]
+            tasks = [asyncio.create_task(c.send_text(message)) for c in batch]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for connection, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    dropped.append(connection)
+
+        for connection in dropped:
+            self.disconnect(connection)
+
+
+manager = ConnectionManager()
+
+
+async def handle_websocket_message(websocket: WebSocket, data: dict):
+    """Process one incoming chat message and reply on the same socket"""
+    query_text = (data.get("query_text") or "").strip()
+    if not query_text:
+        await manager.send_personal_message(
+            json.dumps({"type": "error", "detail": "query_text cannot be empty"}),
+            websocket
+        )
+        return
+
+    retrieved_chunks = retrieval_service.retrieve_relevant_chunks(query=query_text)
+
+    response_id = str(uuid.uuid4())
+
+    # Stream deltas as the model produces them instead of buffering the
+    # whole answer — the first token reaches the client immediately, and
+    # the delta stream itself doubles as the typing indicator
+    if retrieved_chunks:
+        context = "\n\n".join([c.content for c in retrieved_chunks])
+        citations = [
+            {
+                "chunk_id": c.chunk_id,
+                "book_id": c.book_id,
+                "chapter": c.chapter,
+                "section": c.section,
+                "paragraph_index": c.paragraph_index
+            }
+            for c in retrieved_chunks
+        ]
+        for delta in generation_service.stream_response(
+            query_text=query_text, context=context
+        ):
+            await manager.send_personal_message(
+                json.dumps({
+                    "type": "chat_delta",
+                    "response_id": response_id,
+                    "delta": delta
+                }),
+                websocket
+            )
+    else:
+        citations = []
+        await manager.send_personal_message(
+            json.dumps({
+                "type": "chat_delta",
+                "response_id": response_id,
+                "delta": "This information is not available in the book."
+            }),
+            websocket
+        )
+
+    await manager.send_personal_message(
+        json.dumps({
+            "type": "chat_done",
+            "response_id": response_id,
+            "citations": citations
+        }),
+        websocket
+    )
+
+
+@router.websocket("/ws/chat")
+async def websocket_chat(websocket: WebSocket):
+    await manager.connect(websocket)
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError:
+                data = {"query_text": raw}
+            await handle_websocket_message(websocket, data)
+    except WebSocketDisconnect:
+        manager.disconnect(websocket)
@@ -16,6 +16,11 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     
     groq_api_key: str = Field(..., env="GROQ_API_KEY")
+
+    # Auth settings
+    jwt_secret_key: str = Field("dev-secret-change-in-production", alias="JWT_SECRET_KEY")
+    jwt_algorithm: str = "HS256"
+    access_token_expire_minutes: int = 60 * 24
     # Qdrant settings
     qdrant_collection_name: str = "book_content"
     hf_api_token: str
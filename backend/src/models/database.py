@@ -1,10 +1,11 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base
 from contextlib import asynccontextmanager
+from datetime import datetime
 
 
 # Database connection setup
@@ -30,6 +31,27 @@ async def get_async_session(database_url: str):
 Base = declarative_base()
 
 
+class TranslationCache(Base):
+    """Cached chapter/selection translations keyed by content hash"""
+    __tablename__ = "translation_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Raw 16-byte digest (Postgres BYTEA) rather than 64 hex chars: 128 bits
+    # is plenty for a cache key and the btree index is ~4x smaller
+    source_text_hash = Column(LargeBinary(16), index=True, nullable=False)
+    source_language = Column(String(8), nullable=False)
+    target_language = Column(String(8), nullable=False, index=True)
+    translated_text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_accessed = Column(DateTime, default=datetime.utcnow)
+
+    # Lets the expiry DELETE walk an index instead of scanning the table
+    __table_args__ = (
+        Index("ix_translation_cache_updated_at", "updated_at"),
+    )
+
+
 # Dependency for getting database session in FastAPI
 async def get_db_session():
     """Dependency to get database session"""
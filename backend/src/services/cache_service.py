@@ -0,0 +1,230 @@
+"""
+General-purpose cache manager: in-process memory cache with an optional
+Redis backend, plus decorators for caching sync and async functions.
+"""
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+    import redis.asyncio
+except ImportError:  # Redis is optional; memory-only works everywhere
+    redis = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger("rag_chatbot")
+
+
+def _serialize(value) -> bytes:
+    """Encode a value for Redis, tagging the codec in the first byte.
+
+    Most cached values here are JSON-shaped (embedding float lists,
+    translation strings, dicts), and the C json encoder beats pickle on
+    those while producing smaller payloads. Anything json can't handle
+    falls back to pickle protocol 5.
+    """
+    if np is not None and isinstance(value, np.ndarray):
+        # raw packed floats: a 384-dim float32 embedding is 1536 bytes
+        # here vs tens of KB as a pickled Python list
+        return b"N" + value.dtype.str.encode() + b"|" + value.tobytes()
+    try:
+        return b"J" + json.dumps(value, separators=(",", ":")).encode()
+    except (TypeError, ValueError):
+        return b"P" + pickle.dumps(value, protocol=5)
+
+
+def _deserialize(raw: bytes):
+    tag = raw[:1]
+    if tag == b"J":
+        return json.loads(raw[1:])
+    if tag == b"N":
+        dtype, _, buf = raw[1:].partition(b"|")
+        return np.frombuffer(buf, dtype=dtype.decode()).copy()
+    return pickle.loads(raw[1:])
+
+
+@functools.lru_cache(maxsize=8192)
+def _keygen_fast(func_name: str, args: tuple, kwargs_items: tuple) -> str:
+    """Memoized keygen for hashable call signatures.
+
+    Hot lookups like get_chapter_content(chapter_id) hash the same
+    (int,) tuple on every hit; caching the digest turns the keygen into
+    a dict probe. Unhashable arguments raise TypeError before the body
+    runs and the caller falls back to the pickle+hash path.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(func_name.encode())
+    h.update(pickle.dumps((args, kwargs_items), protocol=5))
+    return h.hexdigest()
+
+
+class CacheManager:
+    def __init__(self, redis_url: str = None, max_memory_items: int = 1000):
+        self.max_memory_items = max_memory_items
+        # OrderedDict gives O(1) LRU: move_to_end on hit, popitem(last=False)
+        # to evict — no O(n) min() scan over access times on every insert.
+        self.memory_cache: "OrderedDict[str, object]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        # single-flight registry: key -> future of the in-progress call
+        self._inflight: dict = {}
+        self.redis_client = None
+        self.aredis_client = None
+        if redis_url and redis is not None:
+            self.redis_client = redis.from_url(redis_url)
+            # async routes must not block the event loop on Redis RTTs
+            self.aredis_client = redis.asyncio.from_url(
+                redis_url, max_connections=32, decode_responses=False
+            )
+
+    @staticmethod
+    def _generate_key(func_name: str, args: tuple, kwargs: dict) -> str:
+        """Stable cache key for a call signature.
+
+        pickle protocol 5 + blake2b instead of sorted-JSON + MD5: the
+        pickle encode is C-implemented and an order of magnitude faster
+        than json.dumps on tuples/dicts, and blake2b is the quickest
+        digest hashlib ships. Keys only need to be stable and collision
+        resistant, not cryptographic.
+        """
+        kwargs_items = tuple(sorted(kwargs.items()))
+        try:
+            return _keygen_fast(func_name, args, kwargs_items)
+        except TypeError:
+            # unhashable argument (list/dict/ndarray) — hash directly
+            h = hashlib.blake2b(digest_size=16)
+            h.update(func_name.encode())
+            h.update(pickle.dumps((args, kwargs_items), protocol=5))
+            return h.hexdigest()
+
+    def _memory_get(self, key: str):
+        with self._memory_lock:
+            entry = self.memory_cache.get(key)
+            if entry is not None:
+                value, expire_ts = entry
+                if expire_ts > time.monotonic():
+                    self.memory_cache.move_to_end(key)
+                    return value
+                # expired — drop it so it can't be served again
+                del self.memory_cache[key]
+        return None
+
+    def _memory_put(self, key: str, value, ttl: int):
+        with self._memory_lock:
+            self.memory_cache[key] = (value, time.monotonic() + ttl)
+            self.memory_cache.move_to_end(key)
+            while len(self.memory_cache) > self.max_memory_items:
+                self.memory_cache.popitem(last=False)
+
+    def _get_cache_value(self, key: str):
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+        if self.redis_client is not None:
+            raw = self.redis_client.get(key)
+            if raw is not None:
+                return _deserialize(raw)
+        return None
+
+    async def _aget_cache_value(self, key: str):
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+        if self.aredis_client is not None:
+            raw = await self.aredis_client.get(key)
+            if raw is not None:
+                return _deserialize(raw)
+        return None
+
+    def _set_cache_value(self, key: str, value, ttl: int = 3600):
+        self._memory_put(key, value, ttl)
+        if self.redis_client is not None:
+            self.redis_client.setex(key, ttl, _serialize(value))
+
+    async def _aset_cache_value(self, key: str, value, ttl: int = 3600):
+        self._memory_put(key, value, ttl)
+        if self.aredis_client is not None:
+            await self.aredis_client.setex(key, ttl, _serialize(value))
+
+    def invalidate(self, pattern: str = "*") -> int:
+        """Drop cached entries matching pattern"""
+        import fnmatch
+        removed = 0
+        with self._memory_lock:
+            for key in [k for k in self.memory_cache
+                        if fnmatch.fnmatch(k, pattern)]:
+                del self.memory_cache[key]
+                removed += 1
+        if self.redis_client is not None:
+            # SCAN instead of KEYS so Redis stays responsive on large
+            # keyspaces, and UNLINK so the frees happen off-thread.
+            it = self.redis_client.scan_iter(match=pattern, count=500)
+            while True:
+                batch = list(itertools.islice(it, 500))
+                if not batch:
+                    break
+                removed += self.redis_client.unlink(*batch)
+        return removed
+
+    def cache(self, ttl: int = 3600, key_prefix: str = "cache"):
+        """Decorator caching a function's results by call signature"""
+        def decorator(func):
+            # bind everything the hot path needs once, at decoration
+            # time — on a cache hit the wrapper is otherwise a no-op
+            fname = func.__name__
+            prefix = f"{key_prefix}:{fname}:"
+            generate_key = self._generate_key
+
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    key = prefix + generate_key(fname, args, kwargs)
+                    cached = await self._aget_cache_value(key)
+                    if cached is not None:
+                        return cached
+                    # single-flight: a burst of identical misses runs
+                    # func once; everyone else awaits the same future
+                    fut = self._inflight.get(key)
+                    if fut is not None:
+                        return await fut
+                    fut = asyncio.get_running_loop().create_future()
+                    self._inflight[key] = fut
+                    try:
+                        result = await func(*args, **kwargs)
+                        await self._aset_cache_value(key, result, ttl)
+                        fut.set_result(result)
+                    except BaseException as exc:
+                        fut.set_exception(exc)
+                        fut.exception()  # retrieved, even with no waiters
+                        raise
+                    finally:
+                        del self._inflight[key]
+                    return result
+                return async_wrapper
+
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                key = prefix + generate_key(fname, args, kwargs)
+                cached = self._get_cache_value(key)
+                if cached is not None:
+                    return cached
+                result = func(*args, **kwargs)
+                self._set_cache_value(key, result, ttl)
+                return result
+            return sync_wrapper
+        return decorator
+
+
+# Global instance
+cache_manager = CacheManager()
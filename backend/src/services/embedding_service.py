@@ -125,6 +125,7 @@ from src.models.entities import BookContent
 # embedding_service = EmbeddingService()
 
 
+import numpy as np
 import requests
 from src.config.settings import settings
 
@@ -141,7 +142,7 @@ class EmbeddingService:
             "Content-Type": "application/json"
         }
 
-    def embed_text(self, text: str) -> list[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         payload = {
             "inputs": text,
             "options": {
@@ -161,7 +162,9 @@ class EmbeddingService:
 
         # Case 1: [[float, float, ...]]
         if isinstance(data, list) and isinstance(data[0], list) and isinstance(data[0][0], float):
-            return data[0]
+            # float32 array: 4 bytes/dim instead of ~28 for a PyObject
+            # float, and downstream code can serialize it zero-copy
+            return np.asarray(data[0], dtype=np.float32)
 
         # Case 2: [[[float]]] → mean pooling
         if (
@@ -169,12 +172,9 @@ class EmbeddingService:
             and isinstance(data[0], list)
             and isinstance(data[0][0], list)
         ):
-            vectors = data[0]
-            dim = len(vectors[0])
-            return [
-                sum(token[i] for token in vectors) / len(vectors)
-                for i in range(dim)
-            ]
+            # vectorized mean over the token axis instead of a Python
+            # double loop over tokens × dimensions
+            return np.asarray(data[0], dtype=np.float32).mean(axis=0)
 
         raise ValueError(f"Unexpected embedding response: {data}")
 
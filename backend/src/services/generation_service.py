@@ -213,6 +213,38 @@ ANSWER:
 
         return response.choices[0].message.content.strip()
 
+    def stream_response(self, query_text: str, context: str = ""):
+        """Yield the answer incrementally as the model produces it"""
+        prompt = f"""
+You are a helpful book assistant.
+Use ONLY the context below to answer.
+If the answer is not present, say:
+"This information is not available in the book."
+
+CONTEXT:
+{context}
+
+QUESTION:
+{query_text}
+
+ANSWER:
+"""
+
+        stream = self.client.chat.completions.create(
+            model="llama-3.1-8b-instant",
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.2,
+            max_tokens=400,
+            stream=True
+        )
+
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
 
 generation_service = GenerationService()
 
@@ -0,0 +1,381 @@
+"""
+Translation service with a Postgres-backed translation cache.
+
+Backs the chapter "Translate" action on the site. The provider call is
+mocked for now, but the caching layer is real so swapping in Google/DeepL
+later only touches _mock_translate.
+"""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import sessionmaker
+
+from src.models.database import TranslationCache, get_database_engine
+from src.config.settings import settings
+
+logger = logging.getLogger("rag_chatbot")
+
+# Built once at import: the lookup runs on every translation, and 2.0-style
+# statements with bindparams skip per-call query construction. Only the two
+# columns we actually read are selected, so no ORM object gets hydrated.
+_LOOKUP_STMT = select(
+    TranslationCache.id,
+    TranslationCache.translated_text
+).where(
+    TranslationCache.source_text_hash == bindparam("h"),
+    TranslationCache.source_language == bindparam("s"),
+    TranslationCache.target_language == bindparam("t")
+)
+
+_TOUCH_STMT = update(TranslationCache).where(
+    TranslationCache.id == bindparam("row_id")
+).values(last_accessed=bindparam("now"))
+
+
+class TranslationService:
+    # Hot-layer sizing: a Redis would normally sit here, but this deploys as
+    # a single process, so an in-process LRU gives the same "KV in front of
+    # Postgres" behaviour without new infrastructure
+    MEMORY_CACHE_MAX_ENTRIES = 1024
+    MEMORY_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+    # Aggregate stats drift on the order of minutes, not requests, so the
+    # COUNT/GROUP BY queries behind them are cached briefly
+    STATS_TTL_SECONDS = 60
+
+    def __init__(self):
+        self._engine = None
+        self._session_factory = None
+        # key -> (translated_text, expires_at); ordered oldest-used first
+        self._memory_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # Prebuilt prefix/suffix pairs so the mock never re-formats or
+        # re-uppercases on the hot path
+        self._wrappers = {
+            "ur": ("[URDU TRANSLATION] ", " [TRANSLATED TO URDU]"),
+            "es": ("[SPANISH TRANSLATION] ", " [TRANSLATED TO SPANISH]"),
+            "fr": ("[FRENCH TRANSLATION] ", " [TRANSLATED TO FRENCH]"),
+        }
+        # stats key -> (value, expires_at)
+        self._stats_cache: Dict[str, tuple] = {}
+
+    def _cached_stats(self, key: str, compute):
+        entry = self._stats_cache.get(key)
+        if entry is not None and entry[1] >= time.monotonic():
+            return entry[0]
+        value = compute()
+        self._stats_cache[key] = (value, time.monotonic() + self.STATS_TTL_SECONDS)
+        return value
+
+    def _get_session(self):
+        if self._session_factory is None:
+            self._engine = get_database_engine(settings.neon_database_url)
+            self._session_factory = sessionmaker(bind=self._engine)
+        return self._session_factory()
+
+    @staticmethod
+    def _normalize_language(code: str) -> str:
+        """Canonical language code: lowercase, no stray whitespace.
+
+        Done once at every entry point so downstream comparisons and the
+        DB index always see the same form.
+        """
+        return code.strip().lower()
+
+    @staticmethod
+    def _memory_key(text_hash: bytes, target_language: str) -> str:
+        return f"tr:{target_language}:{text_hash.hex()}"
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        entry = self._memory_cache.get(key)
+        if entry is None:
+            return None
+        translated, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._memory_cache[key]
+            return None
+        self._memory_cache.move_to_end(key)
+        return translated
+
+    def _memory_set(self, key: str, translated: str):
+        self._memory_cache[key] = (
+            translated, time.monotonic() + self.MEMORY_CACHE_TTL_SECONDS
+        )
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.MEMORY_CACHE_MAX_ENTRIES:
+            self._memory_cache.popitem(last=False)
+
+    def _memory_evict(self, target_language: str = None):
+        """Drop hot-layer entries, optionally only for one language"""
+        if target_language is None:
+            self._memory_cache.clear()
+            return
+        prefix = f"tr:{target_language}:"
+        for key in [k for k in self._memory_cache if k.startswith(prefix)]:
+            del self._memory_cache[key]
+
+    @staticmethod
+    def _hash_text(text: str, source_language: str, target_language: str) -> bytes:
+        """16-byte blake2b digest — cache identity, not a security boundary"""
+        payload = f"{source_language}:{target_language}:{text}"
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    # Roughly what Google v3 / DeepL accept per request
+    PROVIDER_MAX_BATCH_BYTES = 30_000
+
+    def _mock_translate_batch(self, texts: List[str], target_language: str) -> List[str]:
+        """Stand-in for one batched provider request.
+
+        Real APIs take a list of strings per call, so N chunks cost one
+        round of TLS/auth/latency instead of N.
+        """
+        return [self._mock_translate(text, target_language) for text in texts]
+
+    def _mock_translate(self, text: str, target_language: str) -> str:
+        """Stand-in for the real translation provider"""
+        wrapper = self._wrappers.get(target_language)
+        if wrapper is None:
+            upper = target_language.upper()
+            wrapper = (f"[{upper} TRANSLATION] ", f" [TRANSLATED TO {upper}]")
+            self._wrappers[target_language] = wrapper
+        prefix, suffix = wrapper
+        return prefix + text + suffix
+
+    @staticmethod
+    def chunk_text(text: str, max_chunk_size: int = 1000) -> List[str]:
+        """Split text on paragraph boundaries into provider-sized chunks"""
+        paragraphs = text.split("\n\n")
+        chunks = []
+        current = ""
+        for paragraph in paragraphs:
+            if current and len(current) + len(paragraph) > max_chunk_size:
+                chunks.append(current)
+                current = paragraph
+            else:
+                current = f"{current}\n\n{paragraph}" if current else paragraph
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def translate_text(self, text: str, source_language: str = "en",
+                       target_language: str = "ur") -> str:
+        """Translate a snippet without touching the cache"""
+        source_language = self._normalize_language(source_language)
+        target_language = self._normalize_language(target_language)
+
+        # Identity translation: the answer is literally the input, so skip
+        # hashing and the provider call entirely
+        if source_language == target_language:
+            return text
+
+        return self._mock_translate(text, target_language)
+
+    def translate_text_with_db(self, text: str, source_language: str = "en",
+                               target_language: str = "ur") -> str:
+        """Translate a snippet, consulting and populating the DB cache"""
+        source_language = self._normalize_language(source_language)
+        target_language = self._normalize_language(target_language)
+
+        if source_language == target_language:
+            return text
+
+        text_hash = self._hash_text(text, source_language, target_language)
+
+        # Hot layer first: a hit never opens a DB session
+        memory_key = self._memory_key(text_hash, target_language)
+        cached = self._memory_get(memory_key)
+        if cached is not None:
+            return cached
+
+        with self._get_session() as db:
+            cached = self.get_cached_translation(
+                db, text_hash, source_language, target_language
+            )
+            if cached is not None:
+                self._memory_set(memory_key, cached)
+                return cached
+
+            translated = self._mock_translate(text, target_language)
+            self.cache_translation(
+                db, text_hash, source_language, target_language, translated
+            )
+            self._memory_set(memory_key, translated)
+            return translated
+
+    def translate_large_text(self, text: str, source_language: str = "en",
+                             target_language: str = "ur") -> str:
+        """Translate long content (whole chapters) chunk by chunk"""
+        source_language = self._normalize_language(source_language)
+        target_language = self._normalize_language(target_language)
+
+        if source_language == target_language:
+            return text
+
+        chunks = self.chunk_text(text)
+
+        # Oversized content falls back to the per-chunk path so no single
+        # request exceeds the provider limit
+        if len(text.encode("utf-8")) > self.PROVIDER_MAX_BATCH_BYTES:
+            return "\n\n".join(
+                self.translate_text_with_db(chunk, source_language, target_language)
+                for chunk in chunks
+            )
+
+        # Resolve what we can from cache, then translate all misses in a
+        # single batched provider call
+        translated_chunks: List[Optional[str]] = [None] * len(chunks)
+        misses = []
+        hashes = []
+        for i, chunk in enumerate(chunks):
+            chunk_hash = self._hash_text(chunk, source_language, target_language)
+            hashes.append(chunk_hash)
+            cached = self._memory_get(self._memory_key(chunk_hash, target_language))
+            if cached is not None:
+                translated_chunks[i] = cached
+            else:
+                misses.append(i)
+
+        if misses:
+            with self._get_session() as db:
+                still_missing = []
+                for i in misses:
+                    cached = self.get_cached_translation(
+                        db, hashes[i], source_language, target_language
+                    )
+                    if cached is not None:
+                        translated_chunks[i] = cached
+                        self._memory_set(
+                            self._memory_key(hashes[i], target_language), cached
+                        )
+                    else:
+                        still_missing.append(i)
+
+                if still_missing:
+                    batch = self._mock_translate_batch(
+                        [chunks[i] for i in still_missing], target_language
+                    )
+                    for i, translated in zip(still_missing, batch):
+                        translated_chunks[i] = translated
+                        self.cache_translation(
+                            db, hashes[i], source_language, target_language, translated
+                        )
+                        self._memory_set(
+                            self._memory_key(hashes[i], target_language), translated
+                        )
+
+        return "\n\n".join(translated_chunks)
+
+    def get_cached_translation(self, db, text_hash: bytes, source_language: str,
+                               target_language: str):
+        """Return the cached translation for a hash, or None on miss"""
+        row = db.execute(_LOOKUP_STMT, {
+            "h": text_hash, "s": source_language, "t": target_language
+        }).first()
+        if row is None:
+            return None
+        db.execute(_TOUCH_STMT, {"row_id": row.id, "now": datetime.utcnow()})
+        db.commit()
+        return row.translated_text
+
+    def cache_translation(self, db, text_hash: bytes, source_language: str,
+                          target_language: str, translated_text: str):
+        """Insert or refresh a cache row for this hash.
+
+        A Core update is tried first: it skips the SELECT, the ORM object
+        load, and the unit-of-work dirty check that the old fetch-mutate-
+        commit pattern paid on every write. Only a miss does the insert.
+        """
+        now = datetime.utcnow()
+        result = db.execute(
+            update(TranslationCache).where(
+                TranslationCache.source_text_hash == text_hash,
+                TranslationCache.source_language == source_language,
+                TranslationCache.target_language == target_language
+            ).values(
+                translated_text=translated_text,
+                updated_at=now,
+                last_accessed=now
+            )
+        )
+        if result.rowcount == 0:
+            db.add(TranslationCache(
+                source_text_hash=text_hash,
+                source_language=source_language,
+                target_language=target_language,
+                translated_text=translated_text
+            ))
+        db.commit()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Overall cache size and language counts (cached ~1 minute)"""
+        def compute():
+            with self._get_session() as db:
+                total = db.query(TranslationCache).count()
+                languages = db.query(
+                    TranslationCache.target_language
+                ).distinct().count()
+                return {"total_entries": total, "target_languages": languages}
+        return self._cached_stats("cache_stats", compute)
+
+    def get_cache_size_by_language(self) -> Dict[str, int]:
+        """Entry counts grouped by target language (cached ~1 minute)"""
+        def compute():
+            from sqlalchemy import func
+            with self._get_session() as db:
+                rows = db.query(
+                    TranslationCache.target_language,
+                    func.count(TranslationCache.id)
+                ).group_by(TranslationCache.target_language).all()
+                return {language: count for language, count in rows}
+        return self._cached_stats("cache_size_by_language", compute)
+
+    # Deleting in bounded batches keeps each transaction (and its locks)
+    # short instead of holding one long-running DELETE over a big cache
+    CLEAR_BATCH_SIZE = 5000
+
+    def _batched_delete(self, db, condition) -> int:
+        deleted = 0
+        while True:
+            batch_ids = select(TranslationCache.id).where(condition).limit(
+                self.CLEAR_BATCH_SIZE
+            )
+            result = db.execute(
+                delete(TranslationCache).where(TranslationCache.id.in_(batch_ids))
+            )
+            db.commit()
+            deleted += result.rowcount
+            if result.rowcount < self.CLEAR_BATCH_SIZE:
+                return deleted
+
+    def clear_expired_cache(self, max_age_days: int = 30) -> int:
+        """Delete entries not updated within max_age_days"""
+        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        with self._get_session() as db:
+            deleted = self._batched_delete(
+                db, TranslationCache.updated_at < cutoff
+            )
+            self._memory_evict()
+            # Drop cached aggregates so admins see the effect immediately
+            self._stats_cache.clear()
+            logger.info(f"Cleared {deleted} expired translation cache entries")
+            return deleted
+
+    def clear_cache_by_language(self, target_language: str) -> int:
+        """Delete all entries for one target language"""
+        target_language = self._normalize_language(target_language)
+        with self._get_session() as db:
+            deleted = self._batched_delete(
+                db, TranslationCache.target_language == target_language
+            )
+            self._memory_evict(target_language)
+            self._stats_cache.clear()
+            logger.info(f"Cleared {deleted} cache entries for {target_language}")
+            return deleted
+
+
+# Global instance
+translation_service = TranslationService()
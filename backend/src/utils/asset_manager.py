@@ -0,0 +1,665 @@
+"""
+Asset management utilities for the book site.
+
+Handles hashing, deduplication and organization of the images and other
+static assets referenced by the Docusaurus markdown chapters.
+"""
+import hashlib
+import logging
+import mmap
+import os
+import re
+import shutil
+import stat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+logger = logging.getLogger("rag_chatbot")
+
+# Above this size, mmap-backed hashing beats the read loop: no per-chunk
+# bytes allocation and hashlib releases the GIL over the whole buffer
+MMAP_HASH_THRESHOLD = 1 << 20
+
+# First-block fingerprint size for the duplicate pre-filter
+FIRST_BLOCK_SIZE = 65536
+
+# Asset types the site ships; lowercase so matching is one frozenset probe
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"})
+DOCUMENT_EXTENSIONS = frozenset({".pdf", ".md", ".mdx", ".txt"})
+
+# Magic bytes for the shallow integrity check: enough to catch renamed or
+# truncated files without decoding the whole image
+_MAGIC_BYTES = {
+    ".png": (b"\x89PNG",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".gif": (b"GIF8",),
+    ".webp": (b"RIFF",),
+}
+
+# Link schemes that never resolve to files on disk
+_NON_FILE_LINK_PREFIXES = ("http://", "https://", "#", "mailto:")
+
+# Markdown link/image syntax, compiled once at import. re's internal cache
+# is small and shared, so the hot batch loops use this constant directly.
+_MD_LINK_RE = re.compile(r'(!?)\[([^\]]*)\]\(([^)]+)\)')
+
+# Bytes twin of the link pattern, for scanning mmap'd files without first
+# copying them into a Python str
+_MD_LINK_RE_BYTES = re.compile(rb'(!?)\[([^\]]*)\]\(([^)]+)\)')
+
+
+class AssetManager:
+    def get_file_hash(self, filepath) -> str:
+        """Content hash of a file, used for dedup and conflict avoidance.
+
+        sha256 through OpenSSL: on current x86/ARM cores that hits the
+        SHA-NI/SHA2 instruction path, which outruns every software
+        digest on bulk data. Large files are hashed straight off an
+        mmap so the kernel page cache is the only copy of the data;
+        smaller ones go through hashlib.file_digest, whose C read+update
+        loop releases the GIL for the whole file.
+        """
+        size = os.stat(filepath).st_size
+        if size >= MMAP_HASH_THRESHOLD:
+            h = hashlib.sha256()
+            with open(filepath, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+            return h.hexdigest()
+        with open(filepath, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    @staticmethod
+    def find_assets_in_directory(directory, extensions=None) -> list:
+        """Recursively list asset files under directory.
+
+        One os.scandir walk with a frozenset extension filter instead of
+        one rglob per pattern: a single readdir pass over the tree, no
+        per-entry stat (DirEntry.is_dir uses the cached dirent type), and
+        case-insensitive matching without doubling the patterns.
+        """
+        return list(AssetManager.iter_assets_in_directory(directory, extensions))
+
+    @staticmethod
+    def iter_assets_in_directory(directory, extensions=None):
+        """Generator form of the scandir walk.
+
+        Streaming callers (organize_assets_by_type) consume entries as
+        they are produced instead of materializing the whole asset list
+        first, keeping peak memory flat on very large trees.
+        """
+        if extensions is None:
+            exts = IMAGE_EXTENSIONS
+        else:
+            exts = frozenset(e.lower() for e in extensions)
+
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in exts:
+                        yield entry.path
+
+    @staticmethod
+    def optimize_image(image_path, output_path=None, max_width: int = 1920,
+                       max_height: int = 1080, quality: int = 85) -> dict:
+        """Downscale and re-encode one image for the site"""
+        src = Path(image_path)
+        if output_path is None:
+            output_path = src.with_name(f"{src.stem}_optimized{src.suffix}")
+
+        original_size = src.stat().st_size
+        with Image.open(src) as img:
+            width, height = img.size
+            if width > max_width or height > max_height:
+                scale = min(max_width / width, max_height / height)
+                new_size = (int(width * scale), int(height * scale))
+                # Let JPEG decode at reduced resolution before resampling
+                img.draft(img.mode, new_size)
+                # reducing_gap makes Pillow do a cheap box reduce first and
+                # only run the full convolution near the target size —
+                # most of the SIMD-resampler win without a new dependency
+                img = img.resize(
+                    new_size, Image.Resampling.LANCZOS, reducing_gap=2.0
+                )
+            img.save(output_path, quality=quality, optimize=True)
+
+        return {
+            "source": str(src),
+            "output": str(output_path),
+            "original_size": original_size,
+            "optimized_size": os.stat(output_path).st_size,
+        }
+
+    def batch_optimize_images(self, image_paths, max_width: int = 1920,
+                              max_height: int = 1080, quality: int = 85) -> dict:
+        """Optimize many images across all cores.
+
+        Resize/encode is CPU-bound per image and the inputs are
+        independent, so the per-image work fans out over a process pool;
+        chunksize amortizes the IPC per task.
+        """
+        # One str conversion per input up front; the loop then only moves
+        # prebuilt tuples around instead of re-parsing paths per iteration
+        tasks = [
+            (str(path), max_width, max_height, quality) for path in image_paths
+        ]
+        results = {}
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for source, result in executor.map(_optimize_one, tasks, chunksize=4):
+                results[source] = result
+        return results
+
+    @staticmethod
+    def extract_links_from_file(md_file) -> list:
+        """Link targets of a markdown file, scanned off an mmap.
+
+        Runs the bytes-level pattern directly against the mapped file and
+        decodes only the matched targets — the full document is never
+        copied into a Python str just to find its links.
+        """
+        with open(md_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [
+                    match.group(3).decode("utf-8", "replace")
+                    for match in _MD_LINK_RE_BYTES.finditer(mm)
+                ]
+
+    @staticmethod
+    def extract_all_asset_links(content: str) -> list:
+        """All link/image targets referenced by a markdown document"""
+        return [match.group(3) for match in _MD_LINK_RE.finditer(content)]
+
+    @staticmethod
+    def update_markdown_links(content: str, old_path: str, new_path: str) -> str:
+        """Rewrite every link pointing at old_path to new_path"""
+        def repl(match):
+            if match.group(3) == old_path:
+                return f"{match.group(1)}[{match.group(2)}]({new_path})"
+            return match.group(0)
+        return _MD_LINK_RE.sub(repl, content)
+
+    def update_markdown_links_batch(self, content: str, asset_mapping: dict) -> str:
+        """Apply a whole old-path -> new-path mapping to a document.
+
+        One regex pass with a dict-dispatched replacement callback: the
+        document is scanned once regardless of mapping size, instead of
+        one full re.sub sweep per mapping entry. Links are matched on the
+        exact (normalized) path first, then on basename so relative
+        variants of the same asset are still caught.
+        """
+        by_full = {os.path.normpath(k): v for k, v in asset_mapping.items()}
+        by_base = {
+            os.path.basename(k): (k, v) for k, v in asset_mapping.items()
+        }
+
+        def repl(match):
+            path = match.group(3)
+            new_path = by_full.get(os.path.normpath(path))
+            if new_path is None:
+                base = os.path.basename(path)
+                entry = by_base.get(base)
+                if entry is None:
+                    return match.group(0)
+                _, new_full = entry
+                new_path = path.replace(base, os.path.basename(new_full))
+            return f"{match.group(1)}[{match.group(2)}]({new_path})"
+
+        return _MD_LINK_RE.sub(repl, content)
+
+    # I/O-bound per-file work: reads release the GIL, so threads give
+    # near-linear speedup up to what the disk can serve
+    MD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+    def _migrate_md_file(self, md_file, destination_img_dir, asset_subdir) -> dict:
+        """Move one markdown file's local assets and rewrite its links"""
+        md_path = Path(md_file)
+
+        mapping = {}
+        # Scan links off the mmap first: files with nothing to migrate
+        # (the common case) are never copied into a str at all
+        for link in self.extract_links_from_file(md_path):
+            if link.startswith(("http://", "https://", "/")):
+                continue
+            source = (md_path.parent / link).resolve()
+            if not source.is_file():
+                continue
+            target = Path(destination_img_dir) / source.name
+            if not target.exists():
+                shutil.copy2(source, target)
+            mapping[link] = f"/{asset_subdir}/{source.name}"
+
+        if mapping:
+            content = md_path.read_text(encoding="utf-8")
+            updated = self.update_markdown_links_batch(content, mapping)
+            if updated != content:
+                md_path.write_text(updated, encoding="utf-8")
+
+        return {"file": str(md_path), "migrated": mapping}
+
+    def migrate_markdown_assets(self, docs_dir, destination_img_dir,
+                                asset_subdir: str = "img") -> dict:
+        """Relocate chapter-local assets into the shared static dir and
+        update every markdown link, processing files concurrently"""
+        os.makedirs(destination_img_dir, exist_ok=True)
+        md_files = self.find_assets_in_directory(docs_dir, extensions={".md", ".mdx"})
+
+        results = {"files": [], "migrated_count": 0}
+        with ThreadPoolExecutor(max_workers=self.MD_WORKERS) as executor:
+            partials = executor.map(
+                lambda f: self._migrate_md_file(f, destination_img_dir, asset_subdir),
+                md_files
+            )
+            for partial in partials:
+                results["files"].append(partial)
+                results["migrated_count"] += len(partial["migrated"])
+        return results
+
+    def batch_update_markdown_links(self, md_files, asset_mapping: dict) -> dict:
+        """Apply one asset mapping to many markdown files concurrently"""
+        def update_one(md_file):
+            md_path = Path(md_file)
+            content = md_path.read_text(encoding="utf-8")
+            updated = self.update_markdown_links_batch(content, asset_mapping)
+            changed = updated != content
+            if changed:
+                md_path.write_text(updated, encoding="utf-8")
+            return str(md_path), changed
+
+        results = {"updated": [], "unchanged": []}
+        with ThreadPoolExecutor(max_workers=self.MD_WORKERS) as executor:
+            for path, changed in executor.map(update_one, md_files):
+                (results["updated"] if changed else results["unchanged"]).append(path)
+        return results
+
+    @staticmethod
+    def validate_asset_path(asset_path, _stat=None) -> dict:
+        """Basic sanity checks for one asset path.
+
+        Accepts a pre-fetched stat result so callers that already
+        stat'ed the file (validate_assets_integrity, get_asset_info)
+        don't trigger another syscall for exists/is_file.
+        """
+        if _stat is None:
+            try:
+                _stat = os.stat(asset_path)
+            except OSError:
+                return {"path": str(asset_path), "valid": False,
+                        "reason": "missing"}
+        if not stat.S_ISREG(_stat.st_mode):
+            return {"path": str(asset_path), "valid": False,
+                    "reason": "not a regular file"}
+        if _stat.st_size == 0:
+            return {"path": str(asset_path), "valid": False, "reason": "empty"}
+        return {"path": str(asset_path), "valid": True}
+
+    @staticmethod
+    def _magic_matches(asset_path, extension: str) -> bool:
+        expected = _MAGIC_BYTES.get(extension)
+        if expected is None:
+            return True  # no signature known (e.g. svg) — accept
+        with open(asset_path, "rb") as f:
+            head = f.read(16)
+        return any(head.startswith(magic) for magic in expected)
+
+    def validate_assets_integrity(self, directory, deep: bool = False) -> dict:
+        """Validate every asset under directory.
+
+        By default only the first 16 bytes of each image are read and
+        matched against the format's magic signature — Image.verify()
+        walks the entire file, which dominated runtime on large asset
+        trees. Pass deep=True to run the full Pillow verification.
+        """
+        def validate_one(asset_path):
+            st = os.stat(asset_path)
+            result = self.validate_asset_path(asset_path, _stat=st)
+            extension = os.path.splitext(asset_path)[1].lower()
+            if result["valid"] and not self._magic_matches(asset_path, extension):
+                result = {"path": asset_path, "valid": False,
+                          "reason": "magic bytes do not match extension"}
+            if result["valid"] and deep and extension != ".svg":
+                try:
+                    with Image.open(asset_path) as img:
+                        img.verify()
+                except Exception as exc:
+                    result = {"path": asset_path, "valid": False,
+                              "reason": f"corrupt image: {exc}"}
+            if result["valid"]:
+                result["info"] = self.get_asset_info(asset_path, _stat=st)
+            return result
+
+        valid = []
+        invalid = []
+        # Embarrassingly parallel and I/O-bound: each asset is a stat plus
+        # a small read, so threads scale with disk parallelism
+        workers = (os.cpu_count() or 1) * 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(
+                validate_one, self.find_assets_in_directory(directory)
+            ):
+                (valid if result["valid"] else invalid).append(result)
+        return {"valid": valid, "invalid": invalid,
+                "total": len(valid) + len(invalid)}
+
+    @staticmethod
+    def get_asset_info(asset_path, _stat=None) -> dict:
+        """Size and mtime details for one asset, from a single stat"""
+        if _stat is None:
+            _stat = os.stat(asset_path)
+        return {
+            "path": str(asset_path),
+            "name": os.path.basename(asset_path),
+            "extension": os.path.splitext(asset_path)[1].lower(),
+            "size_bytes": _stat.st_size,
+            "size_mb": round(_stat.st_size / (1024 * 1024), 3),
+            "modified": _stat.st_mtime,
+        }
+
+    @staticmethod
+    def _fast_copy(src, dst):
+        """Copy file contents in-kernel where the OS allows it.
+
+        copy_file_range can reflink on btrfs/xfs (O(1) metadata copy) and
+        otherwise moves data kernel-to-kernel; sendfile is the next best;
+        shutil.copyfile's userspace loop is the portable fallback.
+        Metadata is preserved with a single copystat afterwards, which is
+        all copy2 adds anyway.
+        """
+        size = os.stat(src).st_size
+        done = False
+        if hasattr(os, "copy_file_range") or hasattr(os, "sendfile"):
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                    offset = 0
+                    while offset < size:
+                        if hasattr(os, "copy_file_range"):
+                            sent = os.copy_file_range(src_fd, dst_fd, size - offset)
+                        else:
+                            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    done = offset >= size
+            except OSError:
+                done = False
+        if not done:
+            shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+
+    def get_file_fingerprint(self, filepath) -> str:
+        """Short non-cryptographic identity for conflict avoidance.
+
+        Call sites truncate to 8 hex chars anyway, so a 16-byte blake2b
+        is already more than enough; kept separate from get_file_hash so
+        anything that later needs a full-width digest still has one.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        size = os.stat(filepath).st_size
+        with open(filepath, "rb") as f:
+            if size >= MMAP_HASH_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+            else:
+                h.update(f.read())
+        return h.hexdigest()
+
+    def copy_asset_to_destination(self, asset_path, destination_dir,
+                                  add_hash: bool = False,
+                                  fast_hash: bool = True) -> str:
+        """Copy an asset into destination_dir, optionally suffixing the
+        name with a fingerprint to avoid collisions.
+
+        With fast_hash (the default) the suffix comes from the file's
+        (size, mtime_ns, basename) — one stat, zero content reads — which
+        already disambiguates virtually every real-world collision. The
+        content fingerprint only runs if that destination name is taken
+        by a file of a different size.
+        """
+        src = Path(asset_path)
+        dest_dir = Path(destination_dir)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        if add_hash:
+            st = src.stat()
+            if fast_hash:
+                suffix = hashlib.blake2b(
+                    f"{st.st_size}:{st.st_mtime_ns}:{src.name}".encode(),
+                    digest_size=4
+                ).hexdigest()
+                target = dest_dir / f"{src.stem}_{suffix}{src.suffix}"
+                if target.exists() and target.stat().st_size != st.st_size:
+                    # Genuine collision — fall back to content identity
+                    fingerprint = self.get_file_fingerprint(src)[:8]
+                    target = dest_dir / f"{src.stem}_{fingerprint}{src.suffix}"
+            else:
+                fingerprint = self.get_file_fingerprint(src)[:8]
+                target = dest_dir / f"{src.stem}_{fingerprint}{src.suffix}"
+        else:
+            target = dest_dir / src.name
+
+        self._fast_copy(src, target)
+        return str(target)
+
+    def organize_assets_by_type(self, source_dir, destination_base_dir) -> dict:
+        """Sort a directory's assets into images/documents/other.
+
+        The per-type destination Paths are built once outside the loop —
+        they're constant — and each asset's Path and suffix are computed
+        a single time per iteration.
+        """
+        dest_base = Path(destination_base_dir)
+        dest_dirs = {
+            asset_type: dest_base / asset_type
+            for asset_type in ("images", "documents", "other")
+        }
+        for dest in dest_dirs.values():
+            dest.mkdir(parents=True, exist_ok=True)
+
+        def organize_one(asset_path):
+            suffix = os.path.splitext(asset_path)[1].lower()
+            if suffix in IMAGE_EXTENSIONS:
+                asset_type = "images"
+            elif suffix in DOCUMENT_EXTENSIONS:
+                asset_type = "documents"
+            else:
+                asset_type = "other"
+            copied = self.copy_asset_to_destination(
+                asset_path, dest_dirs[asset_type], add_hash=True
+            )
+            return asset_type, copied
+
+        organized = {"images": [], "documents": [], "other": []}
+        # Feed the executor straight from the scandir generator — no
+        # materialized asset list, single fused classify+copy pass. Each
+        # copy is an independent syscall sequence; threads keep several
+        # transfers in flight on fast disks.
+        assets = self.iter_assets_in_directory(
+            source_dir, extensions=IMAGE_EXTENSIONS | DOCUMENT_EXTENSIONS
+        )
+        workers = (os.cpu_count() or 1) * 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for asset_type, copied in executor.map(organize_one, assets):
+                organized[asset_type].append(copied)
+        return organized
+
+    def check_broken_links_in_markdown(self, md_files, assets_base_dir) -> dict:
+        """Report links whose target file does not exist.
+
+        The asset tree is walked once up front into a set of resolved
+        paths; each link then costs an O(1) membership probe instead of a
+        stat syscall. Relative links are resolved against a lazily built
+        per-markdown-directory set so repeated probes of the same
+        directory don't re-walk it.
+        """
+        known = set()
+        for root, _, files in os.walk(assets_base_dir):
+            for name in files:
+                known.add(os.path.realpath(os.path.join(root, name)))
+
+        dir_cache = {}
+
+        def known_in_dir(directory):
+            cached = dir_cache.get(directory)
+            if cached is None:
+                cached = set()
+                if os.path.isdir(directory):
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            cached.add(os.path.realpath(entry.path))
+                dir_cache[directory] = cached
+            return cached
+
+        # The inner loop runs once per link across the whole corpus, so
+        # global lookups are bound to locals; the real work per link is
+        # already a compiled-regex match plus a set probe
+        realpath = os.path.realpath
+        join = os.path.join
+        dirname = os.path.dirname
+
+        broken = {}
+        checked = 0
+        for md_file in md_files:
+            checked += 1
+            md_dir = dirname(os.path.abspath(md_file))
+            missing = []
+            for link in self.extract_links_from_file(md_file):
+                if link.startswith(_NON_FILE_LINK_PREFIXES):
+                    continue
+                if link.startswith("/"):
+                    target = realpath(join(assets_base_dir, link.lstrip("/")))
+                    if target not in known:
+                        missing.append(link)
+                else:
+                    target = realpath(join(md_dir, link))
+                    if (target not in known
+                            and target not in known_in_dir(dirname(target))):
+                        missing.append(link)
+            if missing:
+                broken[str(md_file)] = missing
+        return {"broken": broken, "checked_files": checked}
+
+    @staticmethod
+    def _first_block_hash(filepath) -> str:
+        """Cheap fingerprint of the first 64 KiB, used to thin out
+        same-size candidates before paying for a full-content hash"""
+        with open(filepath, "rb") as f:
+            return hashlib.blake2b(f.read(FIRST_BLOCK_SIZE), digest_size=16).hexdigest()
+
+    def find_duplicate_files(self, directory) -> dict:
+        """Map full-content hash -> paths of byte-identical files.
+
+        Read-only view over the staged dedup pipeline: size buckets
+        first (free via stat), then a 64 KiB head fingerprint, and a
+        full hash only for files that still collide — most of the tree
+        is never read at all.
+        """
+        return self.cleanup_duplicate_assets(directory, dry_run=True)[
+            "duplicate_groups"
+        ]
+
+    def cleanup_duplicate_assets(self, directory, dry_run: bool = True) -> dict:
+        """Find (and optionally delete) byte-identical assets.
+
+        Three-stage pipeline: group by size, then by first-block
+        fingerprint, and only full-hash files that still collide. Most
+        same-size-but-distinct files (camera images etc.) drop out after
+        64 KiB instead of being read end to end.
+        """
+        # scandir walk: DirEntry.stat() is served from the directory
+        # read on most filesystems, so sizing the whole tree costs no
+        # extra stat syscalls (os.walk + os.stat pays one per file)
+        by_size = {}
+        sizes = {}
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        size = entry.stat().st_size
+                        sizes[entry.path] = size
+                        by_size.setdefault(size, []).append(entry.path)
+
+        # Hash candidates concurrently: hashlib releases the GIL over each
+        # buffer, so threads overlap the reads and the digest work. (The
+        # ticket suggested io_uring; without liburing bindings in this
+        # stack, a thread pool is the closest way to keep multiple reads
+        # in flight.) Singleton buckets never reach a hasher.
+        workers = (os.cpu_count() or 1) * 2
+
+        candidates = [
+            path for files in by_size.values() if len(files) > 1 for path in files
+        ]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # head fingerprints are constant-cost, no ordering needed
+            first_blocks = dict(zip(
+                candidates, executor.map(self._first_block_hash, candidates)
+            ))
+
+        by_fingerprint = {}
+        for path in candidates:
+            key = (sizes[path], first_blocks[path])
+            by_fingerprint.setdefault(key, []).append(path)
+
+        survivors = [
+            path for group in by_fingerprint.values() if len(group) > 1
+            for path in group
+        ]
+        # largest files first: classic longest-processing-time ordering,
+        # so the pool never finishes with one thread grinding a huge
+        # file while the rest sit idle
+        survivors.sort(key=sizes.__getitem__, reverse=True)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            full_hashes = dict(zip(
+                survivors, executor.map(self.get_file_hash, survivors)
+            ))
+
+        duplicates = {}
+        by_full_hash = {}
+        for path in survivors:
+            by_full_hash.setdefault(full_hashes[path], []).append(path)
+        for full_hash, same in by_full_hash.items():
+            if len(same) > 1:
+                duplicates[full_hash] = sorted(same)
+
+        removed = []
+        if not dry_run:
+            for same in duplicates.values():
+                for path in same[1:]:  # keep the first, drop the rest
+                    os.remove(path)
+                    removed.append(path)
+                    logger.debug("Removed duplicate: %s", path)
+            logger.info("Removed %d duplicate assets", len(removed))
+
+        return {
+            "duplicate_groups": duplicates,
+            "removed": removed,
+            "dry_run": dry_run,
+        }
+
+
+def _optimize_one(task):
+    """Top-level worker so the process pool can pickle it"""
+    image_path, max_width, max_height, quality = task
+    try:
+        result = AssetManager.optimize_image(
+            image_path, max_width=max_width, max_height=max_height, quality=quality
+        )
+    except Exception as exc:
+        result = {"source": str(image_path), "error": str(exc)}
+    return str(image_path), result
+
+
+# Global instance
+asset_manager = AssetManager()
@@ -0,0 +1,190 @@
+"""
+Chapter navigation helpers: prev/next link blocks appended to the
+generated chapter markdown under my-website/docs.
+"""
+import functools
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("rag_chatbot")
+
+NAV_TEMPLATE = """
+<div className="chapter-nav">
+  {prev_link}
+  {next_link}
+</div>
+"""
+
+
+def _chapter_order(chapter: Dict):
+    return chapter.get("order", 9999)
+
+
+# nesting indents precomputed once — "  " * (level - 1) per row would
+# allocate a fresh string for every TOC line
+_INDENTS = tuple("  " * i for i in range(16))
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_template(template: str):
+    """Cache the bound .format of custom templates.
+
+    str.format re-parses the template string on every call; binding it
+    once per distinct template amortizes the parse across the book.
+    """
+    return template.format
+
+
+class ChapterNavigation:
+    MD_SUFFIXES = {".md", ".mdx"}
+    # pure file I/O, so oversubscribe well past the core count
+    MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+    def generate_navigation_markdown(
+        self,
+        prev_chapter: Optional[Dict] = None,
+        next_chapter: Optional[Dict] = None,
+        template: Optional[str] = None,
+    ) -> str:
+        """Render the prev/next navigation block for one chapter.
+
+        Chapters are dicts with at least "title" and "url".
+        """
+        prev_link = (
+            f"[← {prev_chapter['title']}]({prev_chapter['url']})"
+            if prev_chapter else ""
+        )
+        next_link = (
+            f"[{next_chapter['title']} →]({next_chapter['url']})"
+            if next_chapter else ""
+        )
+        if template is None:
+            # inline f-string for the default block — no format parsing
+            return (
+                f'\n<div className="chapter-nav">\n'
+                f'  {prev_link}\n'
+                f'  {next_link}\n'
+                f'</div>\n'
+            )
+        return _compile_template(template)(
+            prev_link=prev_link, next_link=next_link
+        )
+
+    def generate_table_of_contents(self, chapters: List[Dict]) -> str:
+        """Render a markdown TOC for the book.
+
+        Chapters are dicts with "title", "url" and optional "order" and
+        "level". Runs at request time for the site's contents page, so
+        the loop body is one f-string per row: indent strings come from
+        the precomputed table and the sort key is a module-level
+        function rather than a fresh lambda per call.
+        """
+        sorted_chapters = sorted(chapters, key=_chapter_order)
+        lines = ["# Table of Contents", ""]
+        append = lines.append
+        indents = _INDENTS
+        for chapter in sorted_chapters:
+            level = chapter.get("level", 1)
+            indent = (indents[level - 1] if level <= len(indents)
+                      else "  " * (level - 1))
+            append(f"{indent}- [{chapter.get('title', '')}]"
+                   f"({chapter.get('url', '')})")
+        return "\n".join(lines)
+
+    def create_navigation_json(self, chapters: List[Dict],
+                               output_file: str) -> dict:
+        """Write the navigation structure the site consumes as JSON.
+
+        Serialized compact (no indent — pretty-printing roughly triples
+        json encode time and the file is machine-read) and written with
+        one write_bytes call, skipping the text-mode TextIOWrapper.
+        """
+        sorted_chapters = sorted(chapters, key=_chapter_order)
+        nav_structure = {
+            "chapters": [
+                {
+                    "id": c.get("slug", ""),
+                    "title": c.get("title", ""),
+                    "url": c.get("path") or f"/docs/{c.get('slug', '')}",
+                    "order": c.get("order", 9999),
+                }
+                for c in sorted_chapters
+            ]
+        }
+        Path(output_file).write_bytes(
+            json.dumps(nav_structure, separators=(",", ":")).encode()
+        )
+        return nav_structure
+
+    def add_navigation_links_to_chapters(
+        self, chapters: List[Dict]
+    ) -> List[Dict]:
+        """Attach prev/next link dicts to each chapter in order.
+
+        Titles, slugs and urls are pulled into parallel lists up front,
+        so linking neighbours is three list subscripts per side instead
+        of re-probing each neighbour dict with .get for every field.
+        """
+        sorted_chapters = sorted(chapters, key=_chapter_order)
+        slugs = [c.get("slug", "") for c in sorted_chapters]
+        titles = [c.get("title", "") for c in sorted_chapters]
+        urls = [c.get("path") or f"/docs/{s}"
+                for c, s in zip(sorted_chapters, slugs)]
+        last = len(sorted_chapters) - 1
+        for i, chapter in enumerate(sorted_chapters):
+            chapter["prev"] = (
+                {"id": slugs[i - 1], "title": titles[i - 1],
+                 "url": urls[i - 1]}
+                if i > 0 else None
+            )
+            chapter["next"] = (
+                {"id": slugs[i + 1], "title": titles[i + 1],
+                 "url": urls[i + 1]}
+                if i < last else None
+            )
+        return sorted_chapters
+
+    def update_chapter_files_with_navigation(
+        self, chapters_dir: str, chapter_map: Dict[str, tuple]
+    ) -> List[str]:
+        """Append navigation blocks to every chapter file in a directory.
+
+        chapter_map maps a file stem to its (prev_chapter, next_chapter)
+        pair. Each file is rewritten atomically (tmp file + os.replace)
+        so a crash mid-run never leaves a half-written chapter, and the
+        files are processed on a thread pool since this is pure I/O.
+        """
+        chapters_path = Path(chapters_dir)
+        files = [
+            p for p in chapters_path.iterdir()
+            if p.suffix in self.MD_SUFFIXES and p.stem in chapter_map
+        ]
+
+        def _update(p: Path) -> str:
+            prev_chapter, next_chapter = chapter_map[p.stem]
+            nav_md = self.generate_navigation_markdown(prev_chapter, next_chapter)
+            content = p.read_bytes()
+            updated = content.rstrip(b"\n") + b"\n\n" + nav_md.encode()
+            tmp = p.with_suffix(p.suffix + ".tmp")
+            tmp.write_bytes(updated)
+            os.replace(tmp, p)
+            # %s-style so the message is never formatted unless debug
+            # logging is actually on; print() here would take the GIL
+            # and flush per file from every worker thread
+            logger.debug("Added navigation to %s", p.name)
+            return p.name
+
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            updated = list(pool.map(_update, files))
+        logger.info("Added navigation to %d chapter files", len(updated))
+        return updated
+
+
+# Global instance
+chapter_navigation = ChapterNavigation()